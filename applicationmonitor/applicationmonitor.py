@@ -1,14 +1,139 @@
 import discord
+from cachetools import TTLCache
 from redbot.core import commands, Config
 from redbot.core.bot import Red
 from redbot.core.utils.chat_formatting import box
 import logging
-from collections import deque
-from datetime import datetime
+from dataclasses import dataclass, replace
+from operator import itemgetter
 import asyncio
+import time
 
 log = logging.getLogger("red.applicationmonitor")
 
+# Parsed once at import instead of per strftime call on the hot path
+_TS_FMT = "%Y-%m-%d %H:%M:%S"
+
+# How long to wait for more applications before sending a batched notification.
+# Wide enough to catch an invite-wave of applications in one message
+_NOTIFY_DEBOUNCE_SECONDS = 2.0
+
+# How often the write-behind task persists dirty log buffers to Config
+_LOG_FLUSH_SECONDS = 30
+
+# Detection is event-driven via on_member_join; the periodic scan only
+# reconciles drift from missed gateway events, so it can run rarely
+_RECONCILE_SECONDS = 900
+
+# Guilds reconciled concurrently per pass; bounds the in-flight Config and
+# Discord API work so one pass can't swamp the backend
+_RECONCILE_CONCURRENCY = 16
+
+# Log levels stored as small ints in the ring buffer
+LEVEL_INFO = 0
+LEVEL_WARNING = 1
+LEVEL_ERROR = 2
+_LEVEL_NAMES = ("INFO", "WARNING", "ERROR")
+# Level-indexed logger dispatch, resolved once at import
+_LOG_FUNCS = (log.info, log.warning, log.error)
+
+
+class _LogRing:
+    """Fixed-size ring buffer of ``(timestamp, level, message)`` log entries.
+
+    Entries are stored raw; timestamp and level formatting happens lazily
+    when the logs are actually viewed.
+    """
+
+    __slots__ = ("buf", "head", "size")
+
+    def __init__(self, capacity: int = 50):
+        self.buf = [None] * capacity
+        self.head = 0
+        self.size = 0
+
+    def append(self, entry):
+        self.buf[self.head] = entry
+        self.head = (self.head + 1) % len(self.buf)
+        if self.size < len(self.buf):
+            self.size += 1
+
+    def clear(self):
+        self.buf = [None] * len(self.buf)
+        self.head = 0
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def __iter__(self):
+        """Yield entries oldest-first."""
+        capacity = len(self.buf)
+        start = (self.head - self.size) % capacity
+        for i in range(self.size):
+            yield self.buf[(start + i) % capacity]
+
+
+def _format_log_entry(entry) -> str:
+    """Render a ring-buffer entry for display."""
+    if isinstance(entry, str):
+        # Entries persisted before the ring-buffer refactor are already formatted
+        return entry
+    ts, level, message = entry
+    timestamp = time.strftime(_TS_FMT, time.gmtime(int(ts)))
+    return f"[{timestamp}] [{_LEVEL_NAMES[level]}] {message}"
+
+# Invariant parts of the batched-notification embed; Embed.from_dict skips
+# the constructor work for fields that never change between flushes
+_BATCH_EMBED_TEMPLATE = {
+    "title": "🔔 New Membership Applications",
+    "color": 0x3498DB,  # discord.Color.blue()
+}
+
+# Hashes each config key once at import instead of per conversion
+_CONFIG_FIELDS = itemgetter("enabled", "debug", "notification_channel", "notification_role")
+
+# Compiled once at import; show_settings only pays for .format at call time
+_SETTINGS_TEMPLATE = """
+Application Monitor Settings for {guild_name}
+
+Status: {status}
+Debug Mode: {debug}
+Notification Channel: {channel}
+Notification Role: {role}
+
+Server Info:
+Current Pending Members: {pending_count}
+Monitoring Method: Event-driven (reconcile scan every 15m)
+Known Pending: {known_pending}
+"""
+
+
+@dataclass(frozen=True, slots=True)
+class GuildSettings:
+    """Immutable snapshot of a guild's configuration.
+
+    A single instance is shared by every event that reads the cache, so the
+    hot path pays attribute loads instead of dict copies and key hashing.
+    """
+
+    enabled: bool = False
+    debug: bool = False
+    channel_id: int | None = None
+    role_id: int | None = None
+    check_interval: int = 60
+
+    @classmethod
+    def from_config(cls, data: dict) -> "GuildSettings":
+        enabled, debug, channel_id, role_id = _CONFIG_FIELDS(data)
+        return cls(
+            enabled=enabled,
+            debug=debug,
+            channel_id=channel_id,
+            role_id=role_id,
+            check_interval=data.get("check_interval", 60),
+        )
+
 class ApplicationMonitor(commands.Cog):
     """Monitor membership applications and notify specified roles."""
     
@@ -16,8 +141,33 @@ class ApplicationMonitor(commands.Cog):
         self.bot = bot
         self.config = Config.get_conf(self, identifier=1234567890)
         
-        # In-memory log storage (last 50 entries per guild)
-        self.guild_logs = {}
+        # In-memory log storage (last 50 entries per guild). Bounded and
+        # expiring so thousands of silent guilds can't pin log buffers forever
+        self.guild_logs = TTLCache(maxsize=256, ttl=3600)
+
+        # Negative cache of channels we recently failed the permission check
+        # for, so repeated events in the window skip embed construction
+        self._unwritable_channels = TTLCache(maxsize=256, ttl=300)
+
+        # Per-guild debounce state so a burst of applications produces one
+        # notification message instead of one API call per member
+        self._pending_notify = {}
+        self._notify_locks = {}
+        self._notify_tasks = {}
+
+        # Memoized (channel, role) per guild so repeat notifications skip the
+        # guild cache walks; invalidated by the setters and delete events
+        self._resolved_targets = {}
+
+        # Lazily cached "guild has membership screening" flags, invalidated
+        # when the guild itself changes
+        self._has_screening = {}
+
+        # Built once: only the configured role may ping, and Discord skips
+        # scanning the content for other mention types
+        self._allowed_mentions = discord.AllowedMentions(
+            roles=True, everyone=False, users=False, replied_user=False
+        )
         
         # Default settings
         default_guild = {
@@ -25,69 +175,217 @@ class ApplicationMonitor(commands.Cog):
             "notification_role": None,
             "enabled": False,
             "debug": False,
-            "check_interval": 60  # Check every 60 seconds for pending members
+            "check_interval": 60,  # Check every 60 seconds for pending members
+            "logs": []  # Persisted copy of the in-memory log buffer
         }
         
         self.config.register_guild(**default_guild)
-        
+
+        # In-memory cache of guild settings to avoid Config I/O on hot event paths
+        self._settings_cache = {}
+
+        # Guild ids with monitoring enabled, so the reconcile loop never
+        # touches the (vast majority of) guilds that never enabled the cog
+        self.enabled_guilds = set()
+
         # Track known pending members to detect new applications
         self.known_pending = {}
         
-        # Start the background task
+        # Guilds whose log buffer changed since the last flush; the flush task
+        # writes these to Config in batches instead of persisting per append
+        self._dirty_log_guilds = set()
+
+        # Monotonic time of each guild's last reconcile scan, used to honor
+        # per-guild check_interval values above the global pass cadence
+        self._last_reconcile = {}
+
+        # Start the background tasks
         self.check_task = asyncio.create_task(self.periodic_check())
+        self.log_flush_task = asyncio.create_task(self._flush_logs_loop())
     
     def cog_unload(self):
         """Clean up when cog is unloaded."""
-        if hasattr(self, 'check_task'):
-            self.check_task.cancel()
+        check_task = getattr(self, 'check_task', None)
+        if check_task is not None:
+            check_task.cancel()
+        log_flush_task = getattr(self, 'log_flush_task', None)
+        if log_flush_task is not None:
+            log_flush_task.cancel()
+        for task in self._notify_tasks.values():
+            task.cancel()
     
-    def add_log(self, guild_id: int, message: str, level: str = "INFO"):
-        """Add a log entry for a specific guild."""
-        if guild_id not in self.guild_logs:
-            self.guild_logs[guild_id] = deque(maxlen=50)
-        
-        timestamp = datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")
-        log_entry = f"[{timestamp}] [{level}] {message}"
-        self.guild_logs[guild_id].append(log_entry)
-        
-        # Also log to Red's logging system
-        if level == "ERROR":
-            log.error(message)
-        elif level == "WARNING":
-            log.warning(message)
+    async def _get_settings(self, guild_id: int) -> GuildSettings:
+        """Get guild settings from the in-memory cache, loading from Config on a miss."""
+        settings = self._settings_cache.get(guild_id)
+        if settings is None:
+            data = await self.config.guild_from_id(guild_id).all()
+            settings = GuildSettings.from_config(data)
+            self._settings_cache[guild_id] = settings
+        return settings
+
+    def _update_cached_setting(self, guild_id: int, **changes):
+        """Keep the settings cache in sync after a Config write.
+
+        Swaps in a new frozen instance rather than mutating, so readers
+        holding the old snapshot are never left with a half-updated view.
+        """
+        settings = self._settings_cache.get(guild_id)
+        if settings is not None:
+            self._settings_cache[guild_id] = replace(settings, **changes)
         else:
-            log.info(message)
+            # Cold cache - next read will repopulate from Config
+            self._settings_cache.pop(guild_id, None)
+
+    def add_log(self, guild_id: int, message: str, *args, level: int = LEVEL_INFO):
+        """Add a log entry for a specific guild.
+
+        ``message`` is a %-style format string; ``args`` are passed through to
+        the logging module so filtered records skip interpolation entirely.
+        The ring buffer stores raw ``(timestamp, level, message)`` tuples;
+        timestamps are only formatted when the logs are viewed.
+        """
+        ring = self.guild_logs.setdefault(guild_id, _LogRing())
+        # Re-insert to refresh the TTL: expiry should track the last write,
+        # so only guilds silent for the full hour get evicted
+        self.guild_logs[guild_id] = ring
+        formatted = message % args if args else message
+        ring.append((time.time(), level, formatted))
+        self._dirty_log_guilds.add(guild_id)
+
+        # Also log to Red's logging system (lazy interpolation)
+        _LOG_FUNCS[level](message, *args)
     
-    async def periodic_check(self):
-        """Periodically check for new pending members."""
+    async def _flush_logs_loop(self):
+        """Write-behind persistence for the log buffers.
+
+        Bursty add_log traffic only marks its guild dirty; actual Config
+        writes happen here at a fixed cadence, one write per dirty guild.
+        """
         await self.bot.wait_until_ready()
-        
+
         while not self.bot.is_closed():
             try:
-                for guild in self.bot.guilds:
-                    guild_config = await self.config.guild(guild).all()
-                    
-                    if not guild_config["enabled"]:
+                await asyncio.sleep(_LOG_FLUSH_SECONDS)
+
+                dirty = self._dirty_log_guilds
+                self._dirty_log_guilds = set()
+                for guild_id in dirty:
+                    entries = self.guild_logs.get(guild_id)
+                    if entries is None:
+                        # Ring was evicted from the cache between the write and
+                        # this flush; eviction is not "logs were cleared", so
+                        # leave the persisted copy untouched
                         continue
-                    
-                    # Check for pending members
-                    await self.check_pending_members(guild)
-                    
-                # Wait for the configured interval
-                await asyncio.sleep(60)  # Check every minute
-                
+                    await self.config.guild_from_id(guild_id).logs.set(list(entries))
+            except asyncio.CancelledError:
+                raise
             except Exception as e:
-                log.error(f"Error in periodic check: {e}")
-                await asyncio.sleep(60)
+                log.error("Error flushing guild logs: %s", e)
+
+    async def periodic_check(self):
+        """Periodically reconcile pending-member state.
+
+        New applications are detected by on_member_join; this loop only
+        catches members missed while the gateway was disconnected.
+        """
+        await self.bot.wait_until_ready()
+
+        # Monotonic scheduling: the pass starts every _RECONCILE_SECONDS
+        # regardless of how long the work took, instead of drifting by
+        # interval + work_time per iteration
+        next_tick = time.monotonic() + _RECONCILE_SECONDS
+        backoff = 60
+        primed = False
+
+        while not self.bot.is_closed():
+            try:
+                if not primed:
+                    # Prime the settings cache in one bulk read so the first
+                    # tick after a restart doesn't issue a Config lookup per
+                    # guild; restore any logs persisted by the write-behind
+                    # flush while we're at it. Inside the loop so a transient
+                    # backend failure at startup retries with backoff instead
+                    # of killing the task
+                    all_guilds = await self.config.all_guilds()
+                    for guild_id, guild_data in all_guilds.items():
+                        settings = self._settings_cache.setdefault(guild_id, GuildSettings.from_config(guild_data))
+                        if settings.enabled:
+                            self.enabled_guilds.add(guild_id)
+                        persisted_logs = guild_data.get("logs")
+                        if persisted_logs and guild_id not in self.guild_logs:
+                            ring = _LogRing()
+                            for entry in persisted_logs[-50:]:
+                                # JSON round-trips tuples as lists; pre-refactor entries are strings
+                                ring.append(tuple(entry) if isinstance(entry, list) else entry)
+                            self.guild_logs[guild_id] = ring
+                    primed = True
+
+                # Fan out so one slow guild doesn't delay the whole pass,
+                # bounded so a large bot doesn't reconcile everything at once
+                sem = asyncio.Semaphore(_RECONCILE_CONCURRENCY)
+
+                async def _check_one(guild_id):
+                    async with sem:
+                        guild = self.bot.get_guild(guild_id)
+                        if guild is None:
+                            return
+                        # Guilds with check_interval above the pass cadence
+                        # are stretched across multiple passes
+                        settings = await self._get_settings(guild_id)
+                        now = time.monotonic()
+                        if now - self._last_reconcile.get(guild_id, 0.0) < settings.check_interval:
+                            return
+                        self._last_reconcile[guild_id] = now
+                        await self.check_pending_members(guild)
+
+                results = await asyncio.gather(
+                    *(_check_one(guild_id) for guild_id in list(self.enabled_guilds)),
+                    return_exceptions=True,
+                )
+                for result in results:
+                    if isinstance(result, Exception):
+                        log.error("Error in reconcile pass: %s", result)
+
+            except Exception as e:
+                # Back off exponentially so a broken backend isn't hammered
+                # at the steady cadence; resets after the next clean pass
+                log.error("Error in periodic check: %s (retrying in %ss)", e, backoff)
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, _RECONCILE_SECONDS)
+                next_tick = time.monotonic() + _RECONCILE_SECONDS
+                continue
+
+            backoff = 60
+
+            # Wait until the next reconciliation pass
+            await asyncio.sleep(max(0.0, next_tick - time.monotonic()))
+            next_tick += _RECONCILE_SECONDS
     
+    def _guild_has_screening(self, guild) -> bool:
+        """Whether the guild can have pending members at all (cached).
+
+        A rules channel implies a Community guild, which is a prerequisite
+        for membership screening.
+        """
+        has_screening = self._has_screening.get(guild.id)
+        if has_screening is None:
+            has_screening = bool(guild.rules_channel)
+            self._has_screening[guild.id] = has_screening
+        return has_screening
+
     async def check_pending_members(self, guild):
         """Check for new pending members in a guild."""
         try:
-            guild_config = await self.config.guild(guild).all()
-            
-            if not guild_config["enabled"]:
+            settings = await self._get_settings(guild.id)
+
+            if not settings.enabled:
                 return
-            
+
+            # Guilds without membership screening can't have pending members -
+            # skip the full member scan with one cached boolean
+            if not self._guild_has_screening(guild):
+                return
+
             # Get current pending members
             pending_members = [member for member in guild.members if member.pending]
             current_pending_ids = {member.id for member in pending_members}
@@ -99,58 +397,157 @@ class ApplicationMonitor(commands.Cog):
             new_pending_ids = current_pending_ids - known_pending_ids
             
             if new_pending_ids:
-                self.add_log(guild.id, f"Found {len(new_pending_ids)} new pending members")
+                self.add_log(guild.id, "Found %s new pending members", len(new_pending_ids))
                 
                 for member_id in new_pending_ids:
                     member = guild.get_member(member_id)
                     if member:
-                        await self.notify_new_application(member, guild_config)
+                        await self.notify_new_application(member, settings)
             
             # Update known pending members
             self.known_pending[guild.id] = current_pending_ids
             
-            if guild_config["debug"]:
-                self.add_log(guild.id, f"Periodic check: {len(current_pending_ids)} pending members total")
+            if settings.debug:
+                self.add_log(guild.id, "Periodic check: %s pending members total", len(current_pending_ids))
                 
         except Exception as e:
-            self.add_log(guild.id, f"Error checking pending members: {e}", "ERROR")
+            self.add_log(guild.id, "Error checking pending members: %s", e, level=LEVEL_ERROR)
     
-    async def notify_new_application(self, member, guild_config):
-        """Send notification for a new application."""
-        channel_id = guild_config["notification_channel"]
-        role_id = guild_config["notification_role"]
-        
-        if not channel_id or not role_id:
-            self.add_log(member.guild.id, f"Notification config missing for new application from {member}")
-            return
-        
-        channel = member.guild.get_channel(channel_id)
-        role = member.guild.get_role(role_id)
-        
+    async def _resolve_targets(self, guild, settings: GuildSettings):
+        """Resolve the configured notification channel and role for a guild.
+
+        Returns a ``(channel, role)`` tuple, or ``None`` (with a log entry)
+        on any misconfiguration. Successful resolutions (including the
+        permission check) are memoized per guild.
+        """
+        cached = self._resolved_targets.get(guild.id)
+        if cached is not None:
+            return cached
+
+        if not settings.channel_id or not settings.role_id:
+            self.add_log(guild.id, "Notification channel or role not configured", level=LEVEL_WARNING)
+            return None
+
+        channel = guild.get_channel(settings.channel_id)
+        role = guild.get_role(settings.role_id)
+
         if not channel or not role:
-            self.add_log(member.guild.id, f"Invalid channel or role for new application from {member}")
-            return
-        
-        # Create notification message
-        embed = discord.Embed(
+            self.add_log(guild.id, "Invalid notification channel or role configuration", level=LEVEL_WARNING)
+            return None
+
+        if channel.id in self._unwritable_channels:
+            # Already logged when the entry was cached
+            return None
+
+        if not channel.permissions_for(guild.me).send_messages:
+            self._unwritable_channels[channel.id] = True
+            self.add_log(guild.id, "Missing send permission in %s - suppressing notifications", channel.name, level=LEVEL_WARNING)
+            return None
+
+        self._resolved_targets[guild.id] = (channel, role)
+        return channel, role
+
+    def _build_member_embed(self, member, *, title, description, color, timestamp):
+        """Build the common notification embed for a member."""
+        embed = discord.Embed(title=title, description=description, color=color, timestamp=timestamp)
+        embed.add_field(name="User", value=f"{member} ({member.id})", inline=True)
+
+        if member.avatar:
+            embed.set_thumbnail(url=member.avatar.url)
+
+        return embed
+
+    def _build_application_embed(self, member):
+        """Embed for a single new application."""
+        embed = self._build_member_embed(
+            member,
             title="🔔 New Membership Application",
             description=f"**{member.mention}** has applied to join the server and is pending approval.",
             color=discord.Color.blue(),
-            timestamp=member.joined_at or datetime.utcnow()
+            timestamp=member.joined_at or discord.utils.utcnow(),
         )
-        
-        embed.add_field(name="User", value=f"{member} ({member.id})", inline=True)
-        embed.add_field(name="Account Created", value=member.created_at.strftime("%Y-%m-%d %H:%M:%S"), inline=True)
+        embed.add_field(name="Account Created", value=discord.utils.format_dt(member.created_at, style="f"), inline=True)
         embed.add_field(name="Status", value="⏳ Pending Approval", inline=True)
-        
-        if member.avatar:
-            embed.set_thumbnail(url=member.avatar.url)
-        
+        return embed
+
+    def _build_approval_embed(self, member):
+        """Embed for a completed membership screening."""
+        embed = self._build_member_embed(
+            member,
+            title="✅ Application Approved",
+            description=f"**{member.mention}** has completed membership screening and joined the server!",
+            color=discord.Color.green(),
+            timestamp=discord.utils.utcnow(),
+        )
+        embed.add_field(name="Originally Joined", value=discord.utils.format_dt(member.joined_at, style="f") if member.joined_at else "Unknown", inline=True)
+        return embed
+
+    async def _send_notification(self, channel, role, embed, text):
+        """Send a role-mention notification to a channel, logging the outcome."""
+        guild_id = channel.guild.id
         try:
-            await channel.send(f"{role.mention} - New application received!", embed=embed)
-            self.add_log(member.guild.id, f"Sent application notification for {member} to {channel.name}")
+            await channel.send(f"{role.mention} - {text}", embed=embed, allowed_mentions=self._allowed_mentions)
+            self.add_log(guild_id, "Sent notification to %s: %s", channel.name, text)
+        except discord.NotFound:
+            # Memoized channel went stale (deleted while we were disconnected);
+            # drop it so the next notification re-resolves from config
+            self._resolved_targets.pop(guild_id, None)
+            self.add_log(guild_id, "Notification channel %s no longer exists", channel.name, level=LEVEL_ERROR)
+        except discord.Forbidden:
+            # Send permission revoked after the targets were memoized; evict
+            # the memo and negative-cache the channel so _resolve_targets
+            # suppresses further attempts for the window
+            self._resolved_targets.pop(guild_id, None)
+            self._unwritable_channels[channel.id] = True
+            self.add_log(guild_id, "Missing send permission in %s - suppressing notifications", channel.name, level=LEVEL_ERROR)
+        except Exception as e:
+            self.add_log(guild_id, "Error sending notification: %s", e, level=LEVEL_ERROR)
+
+    async def notify_new_application(self, member, settings: GuildSettings):
+        """Queue a new-application notification, coalescing bursts into one message."""
+        guild_id = member.guild.id
+        lock = self._notify_locks.setdefault(guild_id, asyncio.Lock())
+
+        async with lock:
+            self._pending_notify.setdefault(guild_id, []).append(member)
+            if guild_id not in self._notify_tasks:
+                self._notify_tasks[guild_id] = asyncio.create_task(
+                    self._drain_notifications(member.guild, settings)
+                )
+
+    async def _drain_notifications(self, guild, settings: GuildSettings):
+        """Wait out the debounce window, then send one notification for the batch."""
+        try:
+            await asyncio.sleep(_NOTIFY_DEBOUNCE_SECONDS)
+
+            async with self._notify_locks[guild.id]:
+                members = self._pending_notify.pop(guild.id, [])
+                self._notify_tasks.pop(guild.id, None)
+
+            if not members:
+                return
+
+            targets = await self._resolve_targets(guild, settings)
+            if targets is None:
+                return
+            channel, role = targets
+
+            if len(members) == 1:
+                embed = self._build_application_embed(members[0])
+                await self._send_notification(channel, role, embed, "New application received!")
+            else:
+                embed = discord.Embed.from_dict(_BATCH_EMBED_TEMPLATE)
+                embed.description = f"**{len(members)}** users have applied to join the server and are pending approval."
+                embed.timestamp = discord.utils.utcnow()
+                for member in members[:25]:  # Embed field limit
+                    embed.add_field(name=str(member), value=f"{member.mention} ({member.id})", inline=True)
+                if len(members) > 25:
+                    embed.set_footer(text=f"Showing first 25 of {len(members)} applications")
+                await self._send_notification(channel, role, embed, f"{len(members)} new applications received!")
+        except asyncio.CancelledError:
+            raise
         except Exception as e:
-            self.add_log(member.guild.id, f"Error sending application notification: {e}", "ERROR")
+            self.add_log(guild.id, "Error sending batched notification: %s", e, level=LEVEL_ERROR)
     
     @commands.group()
     @commands.guild_only()
@@ -165,9 +562,14 @@ class ApplicationMonitor(commands.Cog):
         """Set the notification channel for application alerts."""
         if channel is None:
             await self.config.guild(ctx.guild).notification_channel.set(None)
+            self._update_cached_setting(ctx.guild.id, channel_id=None)
+            self._resolved_targets.pop(ctx.guild.id, None)
             await ctx.send("Notification channel has been cleared.")
         else:
             await self.config.guild(ctx.guild).notification_channel.set(channel.id)
+            self._update_cached_setting(ctx.guild.id, channel_id=channel.id)
+            self._unwritable_channels.pop(channel.id, None)
+            self._resolved_targets.pop(ctx.guild.id, None)
             await ctx.send(f"Notification channel set to {channel.mention}")
     
     @appmonitor.command()
@@ -175,44 +577,58 @@ class ApplicationMonitor(commands.Cog):
         """Set the role to notify when applications are received."""
         if role is None:
             await self.config.guild(ctx.guild).notification_role.set(None)
+            self._update_cached_setting(ctx.guild.id, role_id=None)
+            self._resolved_targets.pop(ctx.guild.id, None)
             await ctx.send("Notification role has been cleared.")
         else:
             await self.config.guild(ctx.guild).notification_role.set(role.id)
+            self._update_cached_setting(ctx.guild.id, role_id=role.id)
+            self._resolved_targets.pop(ctx.guild.id, None)
             await ctx.send(f"Notification role set to {role.mention}")
     
     @appmonitor.command()
     async def toggle(self, ctx):
         """Enable or disable application monitoring."""
-        current = await self.config.guild(ctx.guild).enabled()
+        current = (await self._get_settings(ctx.guild.id)).enabled
         await self.config.guild(ctx.guild).enabled.set(not current)
+        self._update_cached_setting(ctx.guild.id, enabled=not current)
         status = "enabled" if not current else "disabled"
         
         if not current:  # If we just enabled it
+            self.enabled_guilds.add(ctx.guild.id)
             # Initialize known pending members (mark existing ones as already known)
             pending_members = [member for member in ctx.guild.members if member.pending]
             self.known_pending[ctx.guild.id] = {member.id for member in pending_members}
-            self.add_log(ctx.guild.id, f"Monitoring enabled. Marked {len(pending_members)} existing pending members as known (won't notify for these).")
+            self.add_log(ctx.guild.id, "Monitoring enabled. Marked %s existing pending members as known (won't notify for these).", len(pending_members))
             await ctx.send(f"Application monitoring has been {status}.\n✅ Found {len(pending_members)} existing pending members - these won't trigger notifications.\n🔔 Only **new** applications from now on will send notifications.")
         else:
+            self.enabled_guilds.discard(ctx.guild.id)
             # Clear known pending when disabling
             if ctx.guild.id in self.known_pending:
                 del self.known_pending[ctx.guild.id]
-            self.add_log(ctx.guild.id, f"Monitoring disabled. Cleared known pending members.")
+            self.add_log(ctx.guild.id, "Monitoring disabled. Cleared known pending members.")
             await ctx.send(f"Application monitoring has been {status}.")
     
     @appmonitor.command()
     async def debug(self, ctx):
         """Toggle debug mode for troubleshooting."""
-        current = await self.config.guild(ctx.guild).debug()
+        current = (await self._get_settings(ctx.guild.id)).debug
         await self.config.guild(ctx.guild).debug.set(not current)
+        self._update_cached_setting(ctx.guild.id, debug=not current)
         status = "enabled" if not current else "disabled"
         await ctx.send(f"Debug mode has been {status}.")
     
     @appmonitor.command()
     async def pending(self, ctx):
         """Show current pending members."""
-        pending_members = [member for member in ctx.guild.members if member.pending]
-        
+        known = self.known_pending.get(ctx.guild.id)
+        if known is not None:
+            # O(known) lookups against the incrementally maintained set
+            pending_members = [member for member in map(ctx.guild.get_member, known) if member is not None]
+        else:
+            # Monitoring disabled - no tracked set, fall back to a full scan
+            pending_members = [member for member in ctx.guild.members if member.pending]
+
         if not pending_members:
             await ctx.send("No pending members found.")
             return
@@ -220,13 +636,13 @@ class ApplicationMonitor(commands.Cog):
         embed = discord.Embed(
             title="📋 Current Pending Members",
             color=discord.Color.orange(),
-            timestamp=datetime.utcnow()
+            timestamp=discord.utils.utcnow()
         )
         
         for i, member in enumerate(pending_members[:25], 1):  # Limit to 25 for embed limits
             embed.add_field(
                 name=f"{i}. {member}",
-                value=f"ID: {member.id}\nJoined: {member.joined_at.strftime('%Y-%m-%d %H:%M:%S') if member.joined_at else 'Unknown'}",
+                value=f"ID: {member.id}\nJoined: {discord.utils.format_dt(member.joined_at, style='f') if member.joined_at else 'Unknown'}",
                 inline=True
             )
         
@@ -240,7 +656,7 @@ class ApplicationMonitor(commands.Cog):
         """Reset the known pending members list (useful if you got wrong notifications)."""
         pending_members = [member for member in ctx.guild.members if member.pending]
         self.known_pending[ctx.guild.id] = {member.id for member in pending_members}
-        self.add_log(ctx.guild.id, f"Reset known pending members. Marked {len(pending_members)} current pending members as known.")
+        self.add_log(ctx.guild.id, "Reset known pending members. Marked %s current pending members as known.", len(pending_members))
     @appmonitor.command()
     async def forcescan(self, ctx):
         """Force scan for pending members now."""
@@ -255,14 +671,14 @@ class ApplicationMonitor(commands.Cog):
     @appmonitor.command()
     async def test(self, ctx):
         """Send a test notification to verify setup."""
-        guild_config = await self.config.guild(ctx.guild).all()
-        
-        if not guild_config["enabled"]:
+        settings = await self._get_settings(ctx.guild.id)
+
+        if not settings.enabled:
             await ctx.send("❌ Application monitoring is disabled. Enable it first with `[p]appmonitor toggle`")
             return
-            
-        channel_id = guild_config["notification_channel"]
-        role_id = guild_config["notification_role"]
+
+        channel_id = settings.channel_id
+        role_id = settings.role_id
         
         if not channel_id or not role_id:
             await ctx.send("❌ Please configure both channel and role first.")
@@ -283,15 +699,15 @@ class ApplicationMonitor(commands.Cog):
         )
         
         try:
-            await channel.send(f"{role.mention} - Test notification!", embed=embed)
+            await channel.send(f"{role.mention} - Test notification!", embed=embed, allowed_mentions=self._allowed_mentions)
             await ctx.send(f"✅ Test notification sent to {channel.mention}")
-            self.add_log(ctx.guild.id, f"Test notification sent successfully to {channel.name}")
+            self.add_log(ctx.guild.id, "Test notification sent successfully to %s", channel.name)
         except discord.Forbidden:
             await ctx.send(f"❌ Missing permissions to send message in {channel.mention}")
-            self.add_log(ctx.guild.id, f"Missing permissions to send message in {channel.name}", "ERROR")
+            self.add_log(ctx.guild.id, "Missing permissions to send message in %s", channel.name, level=LEVEL_ERROR)
         except Exception as e:
             await ctx.send(f"❌ Error sending test notification: {e}")
-            self.add_log(ctx.guild.id, f"Error sending test notification: {e}", "ERROR")
+            self.add_log(ctx.guild.id, "Error sending test notification: %s", e, level=LEVEL_ERROR)
     
     @appmonitor.command()
     async def logs(self, ctx, lines: int = 20):
@@ -305,38 +721,37 @@ class ApplicationMonitor(commands.Cog):
         # Limit lines to reasonable amount
         lines = min(max(lines, 1), 50)
         
-        # Get the most recent logs
-        recent_logs = list(self.guild_logs[guild_id])[-lines:]
+        # Get the most recent logs; entries are formatted only here, at view time
+        recent_logs = [_format_log_entry(entry) for entry in list(self.guild_logs[guild_id])[-lines:]]
         
         if not recent_logs:
             await ctx.send("No logs available for this server.")
             return
         
-        # Format logs for display
-        log_text = "\n".join(recent_logs)
-        
-        # Split into chunks if too long for Discord
-        if len(log_text) > 1900:  # Leave room for code block formatting
-            chunks = []
-            current_chunk = ""
-            
-            for log_line in recent_logs:
-                if len(current_chunk + log_line + "\n") > 1900:
-                    if current_chunk:
-                        chunks.append(current_chunk)
-                    current_chunk = log_line + "\n"
-                else:
-                    current_chunk += log_line + "\n"
-            
-            if current_chunk:
-                chunks.append(current_chunk)
-            
-            # Send chunks
-            for i, chunk in enumerate(chunks):
-                header = f"Application Monitor Logs (Part {i+1}/{len(chunks)})" if len(chunks) > 1 else "Application Monitor Logs"
-                await ctx.send(f"**{header}**\n{box(chunk, lang='log')}")
+        # Build chunks in a single pass, joining each one once instead of
+        # pre-joining everything and re-splitting when it's too long
+        chunks = []
+        current_lines = []
+        current_len = 0
+
+        for log_line in recent_logs:
+            line_len = len(log_line) + 1  # +1 for the newline
+            if current_lines and current_len + line_len > 1900:  # Leave room for code block formatting
+                chunks.append("\n".join(current_lines))
+                current_lines = [log_line]
+                current_len = line_len
+            else:
+                current_lines.append(log_line)
+                current_len += line_len
+
+        if current_lines:
+            chunks.append("\n".join(current_lines))
+
+        if len(chunks) == 1:
+            await ctx.send(f"**Application Monitor Logs (Last {len(recent_logs)} entries)**\n{box(chunks[0], lang='log')}")
         else:
-            await ctx.send(f"**Application Monitor Logs (Last {len(recent_logs)} entries)**\n{box(log_text, lang='log')}")
+            for i, chunk in enumerate(chunks):
+                await ctx.send(f"**Application Monitor Logs (Part {i+1}/{len(chunks)})**\n{box(chunk, lang='log')}")
     
     @appmonitor.command()
     async def clearlogs(self, ctx):
@@ -345,6 +760,7 @@ class ApplicationMonitor(commands.Cog):
         
         if guild_id in self.guild_logs:
             self.guild_logs[guild_id].clear()
+            self._dirty_log_guilds.add(guild_id)
             await ctx.send("✅ Logs cleared for this server.")
         else:
             await ctx.send("No logs to clear for this server.")
@@ -356,84 +772,108 @@ class ApplicationMonitor(commands.Cog):
     
     async def show_settings(self, ctx):
         """Display current settings for the guild."""
-        guild_config = await self.config.guild(ctx.guild).all()
-        
-        enabled = guild_config["enabled"]
-        debug = guild_config["debug"]
-        channel_id = guild_config["notification_channel"]
-        role_id = guild_config["notification_role"]
-        
-        channel = ctx.guild.get_channel(channel_id) if channel_id else None
-        role = ctx.guild.get_role(role_id) if role_id else None
-        
-        # Check server access settings
-        pending_members = [member for member in ctx.guild.members if member.pending]
-        
-        settings_text = f"""
-        Application Monitor Settings for {ctx.guild.name}
-        
-        Status: {'Enabled' if enabled else 'Disabled'}
-        Debug Mode: {'Enabled' if debug else 'Disabled'}
-        Notification Channel: {channel.mention if channel else 'Not Set'}
-        Notification Role: {role.mention if role else 'Not Set'}
-        
-        Server Info:
-        Current Pending Members: {len(pending_members)}
-        Monitoring Method: Periodic Scanning (every 60s)
-        Known Pending: {len(self.known_pending.get(ctx.guild.id, set()))}
-        """
+        settings = await self._get_settings(ctx.guild.id)
+
+        channel = ctx.guild.get_channel(settings.channel_id) if settings.channel_id else None
+        role = ctx.guild.get_role(settings.role_id) if settings.role_id else None
         
+        # Tracked pending set, maintained by the member listeners; O(1)
+        # instead of scanning every member for a display count
+        pending_count = len(self.known_pending.get(ctx.guild.id, ()))
+
+        settings_text = _SETTINGS_TEMPLATE.format(
+            guild_name=ctx.guild.name,
+            status='Enabled' if settings.enabled else 'Disabled',
+            debug='Enabled' if settings.debug else 'Disabled',
+            channel=channel.mention if channel else 'Not Set',
+            role=role.mention if role else 'Not Set',
+            pending_count=pending_count,
+            known_pending=pending_count,
+        )
+
         await ctx.send(box(settings_text, lang="yaml"))
     
+    @commands.Cog.listener()
+    async def on_member_join(self, member):
+        """Event-driven detection: notify as soon as a pending member joins."""
+        if not member.pending:
+            return
+
+        # Sync settings fast path; only a cold cache pays for a Config read
+        settings = self._settings_cache.get(member.guild.id)
+        if settings is None:
+            settings = await self._get_settings(member.guild.id)
+        if not settings.enabled:
+            return
+
+        known = self.known_pending.setdefault(member.guild.id, set())
+        if member.id in known:
+            return
+        known.add(member.id)
+
+        if settings.debug:
+            self.add_log(member.guild.id, "New pending member joined: %s (%s)", member, member.id)
+
+        await self.notify_new_application(member, settings)
+
+    @commands.Cog.listener()
+    async def on_member_remove(self, member):
+        """Keep the pending set consistent when a member leaves or is kicked."""
+        known = self.known_pending.get(member.guild.id)
+        if known is not None:
+            known.discard(member.id)
+
+    @commands.Cog.listener()
+    async def on_guild_update(self, before, after):
+        """Invalidate the cached screening flag when guild settings change."""
+        self._has_screening.pop(after.id, None)
+
+    @commands.Cog.listener()
+    async def on_guild_channel_delete(self, channel):
+        """Drop memoized notification targets when a channel is deleted."""
+        self._resolved_targets.pop(channel.guild.id, None)
+
+    @commands.Cog.listener()
+    async def on_guild_role_delete(self, role):
+        """Drop memoized notification targets when a role is deleted."""
+        self._resolved_targets.pop(role.guild.id, None)
+
     @commands.Cog.listener()
     async def on_member_update(self, before, after):
         """Triggered when a member's status changes (including passing screening)."""
-        guild_config = await self.config.guild(after.guild).all()
-        
-        # Check if this is a membership screening completion
-        if before.pending and not after.pending:
-            self.add_log(after.guild.id, f"Member screening completed: {after} ({after.id})")
-            
-            # Remove from known pending
-            if after.guild.id in self.known_pending:
-                self.known_pending[after.guild.id].discard(after.id)
-            
-            # Check if monitoring is enabled
-            if not guild_config["enabled"]:
-                self.add_log(after.guild.id, f"Monitoring disabled - skipping approval notification")
-                return
-                
-            # Get configuration
-            channel_id = guild_config["notification_channel"]
-            role_id = guild_config["notification_role"]
-            
-            if not channel_id or not role_id:
-                self.add_log(after.guild.id, f"Channel or role not configured for approval notifications", "WARNING")
-                return
-                
-            channel = after.guild.get_channel(channel_id)
-            role = after.guild.get_role(role_id)
-            
-            if not channel or not role:
-                self.add_log(after.guild.id, f"Invalid channel or role for approval notifications", "WARNING")
-                return
-                
-            # Create approval notification
-            embed = discord.Embed(
-                title="✅ Application Approved",
-                description=f"**{after.mention}** has completed membership screening and joined the server!",
-                color=discord.Color.green(),
-                timestamp=discord.utils.utcnow()
-            )
-            
-            embed.add_field(name="User", value=f"{after} ({after.id})", inline=True)
-            embed.add_field(name="Originally Joined", value=after.joined_at.strftime("%Y-%m-%d %H:%M:%S") if after.joined_at else "Unknown", inline=True)
-            
-            if after.avatar:
-                embed.set_thumbnail(url=after.avatar.url)
-            
-            try:
-                await channel.send(f"{role.mention} - Member approved!", embed=embed)
-                self.add_log(after.guild.id, f"Sent approval notification for {after} to {channel.name}")
-            except Exception as e:
-                self.add_log(after.guild.id, f"Error sending approval notification: {e}", "ERROR")
+        # Most member updates are role/nickname changes - reject anything that
+        # isn't a pending transition before doing any other work
+        completed_screening = before.pending and not after.pending
+        became_pending = after.pending and not before.pending
+        if not (completed_screening or became_pending):
+            return
+
+        # Pure sync fast path: bail out before any coroutine suspension when
+        # monitoring is off for this guild (the common case on busy bots)
+        settings = self._settings_cache.get(after.guild.id)
+        if settings is None:
+            # Cold cache - only here do we pay for a Config read
+            settings = await self._get_settings(after.guild.id)
+        if not settings.enabled:
+            return
+
+        if became_pending:
+            # Screening was (re)applied to an existing member - just track it
+            self.known_pending.setdefault(after.guild.id, set()).add(after.id)
+            return
+
+        if settings.debug:
+            self.add_log(after.guild.id, "Member screening completed: %s (%s)", after, after.id)
+
+        # Remove from known pending
+        if after.guild.id in self.known_pending:
+            self.known_pending[after.guild.id].discard(after.id)
+
+        targets = await self._resolve_targets(after.guild, settings)
+        if targets is None:
+            return
+        channel, role = targets
+
+        # Create approval notification
+        embed = self._build_approval_embed(after)
+        await self._send_notification(channel, role, embed, "Member approved!")